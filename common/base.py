@@ -76,7 +76,7 @@ class ToolBase:
             if context_path.exists():
                 return context_path.read_text()
         except Exception as e:
-            logger.warning(f"Failed to load context file {context_file}: {e}")
+            logger.warning("Failed to load context file %s: %s", context_file, e)
         
         return fallback_content
     
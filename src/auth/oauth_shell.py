@@ -6,69 +6,75 @@ Provides OAuth-like endpoints for MCP client authentication without browser inte
 Auto-approves all requests for headless/containerized environments.
 """
 
+import functools
 import logging
-from datetime import datetime
-from urllib.parse import urlencode
+import secrets
+import time
+from typing import Any, AsyncIterator, Dict, Tuple
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
 
+import orjson
+from starlette.formparsers import MultiPartParser
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import JSONResponse, RedirectResponse, Response
 
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
 
-async def oauth_authorization_server(request: Request):
-    """
-    OAuth authorization server discovery endpoint.
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json encoder."""
     
-    Provides OAuth 2.0 server metadata for MCP client discovery.
-    This is a shell/fake OAuth implementation for headless environments.
-    """
-    return JSONResponse({
-        "issuer": f"http://localhost:{Config.DEFAULT_PORT}",
-        "authorization_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/auth",
-        "token_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/token",
-        "registration_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/register",
-        "response_types_supported": ["code"],
-        "grant_types_supported": ["authorization_code"],
-        "scopes_supported": ["mcp"],
-        "code_challenge_methods_supported": ["S256"],
-        "headless_supported": True,
-        "shell_auth": True,
-        "auto_approve": True
-    })
-
-
-async def oauth_authorization_server_mcp(request: Request):
-    """
-    MCP-specific OAuth authorization server discovery endpoint.
-    
-    Same as oauth_authorization_server but specifically for MCP clients.
-    """
-    return JSONResponse({
-        "issuer": f"http://localhost:{Config.DEFAULT_PORT}",
-        "authorization_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/auth",
-        "token_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/token",
-        "registration_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/register",
-        "response_types_supported": ["code"],
-        "grant_types_supported": ["authorization_code"],
-        "scopes_supported": ["mcp"],
-        "code_challenge_methods_supported": ["S256"],
-        "headless_supported": True,
-        "shell_auth": True,
-        "auto_approve": True
-    })
-
-
-async def oauth_protected_resource(request: Request):
-    """OAuth protected resource discovery endpoint."""
-    return JSONResponse({
-        "resource_server": f"http://localhost:{Config.DEFAULT_PORT}",
-        "authorization_servers": [f"http://localhost:{Config.DEFAULT_PORT}"],
-        "scopes_supported": ["mcp"],
-        "bearer_methods_supported": ["header", "query"]
-    })
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Discovery metadata depends only on Config, so it is serialized once at import
+# and every probe is answered with the same pre-rendered body.
+_OAUTH_DISCOVERY_BYTES = orjson.dumps({
+    "issuer": f"http://localhost:{Config.DEFAULT_PORT}",
+    "authorization_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/auth",
+    "token_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/token",
+    "registration_endpoint": f"http://localhost:{Config.DEFAULT_PORT}/register",
+    "response_types_supported": ["code"],
+    "grant_types_supported": ["authorization_code"],
+    "scopes_supported": ["mcp"],
+    "code_challenge_methods_supported": ["S256"],
+    "headless_supported": True,
+    "shell_auth": True,
+    "auto_approve": True
+})
+
+_OAUTH_PROTECTED_RESOURCE_BYTES = orjson.dumps({
+    "resource_server": f"http://localhost:{Config.DEFAULT_PORT}",
+    "authorization_servers": [f"http://localhost:{Config.DEFAULT_PORT}"],
+    "scopes_supported": ["mcp"],
+    "bearer_methods_supported": ["header", "query"]
+})
+
+
+# Clients may cache discovery metadata; it only changes on restart with a new port.
+_DISCOVERY_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# OAuth authorization server discovery endpoint.
+#
+# Provides OAuth 2.0 server metadata for MCP client discovery. This is a
+# shell/fake OAuth implementation for headless environments. The response is
+# built once and mounted directly as an ASGI app, so a probe costs no handler
+# coroutine, dict or serialization. Serves both discovery routes.
+oauth_authorization_server = Response(
+    _OAUTH_DISCOVERY_BYTES,
+    media_type="application/json",
+    headers=_DISCOVERY_HEADERS
+)
+
+# OAuth protected resource discovery endpoint (pre-rendered, see above).
+oauth_protected_resource = Response(
+    _OAUTH_PROTECTED_RESOURCE_BYTES,
+    media_type="application/json",
+    headers=_DISCOVERY_HEADERS
+)
 
 
 async def register_client(request: Request):
@@ -76,16 +82,16 @@ async def register_client(request: Request):
     try:
         client_data = await request.json()
         
-        # Generate fake client credentials
-        client_id = f"mcp_tools_client_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        client_secret = f"secret_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Generate fake client credentials (random, so bursts never collide)
+        client_id = f"mcp_tools_client_{secrets.token_urlsafe(16)}"
+        client_secret = f"secret_{secrets.token_urlsafe(16)}"
         
-        logger.info(f"Shell auth: Registered client {client_id}")
+        logger.info("Shell auth: Registered client %s", client_id)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "client_id": client_id,
             "client_secret": client_secret,
-            "client_id_issued_at": int(datetime.now().timestamp()),
+            "client_id_issued_at": int(time.time()),
             "client_secret_expires_at": 0,  # Never expires
             "redirect_uris": client_data.get("redirect_uris", []),
             "grant_types": ["authorization_code"],
@@ -95,42 +101,55 @@ async def register_client(request: Request):
         })
         
     except Exception as e:
-        logger.error(f"Registration error: {e}")
-        return JSONResponse(
+        logger.error("Registration error: %s", e)
+        return ORJSONResponse(
             {"error": "invalid_client_metadata", "error_description": str(e)},
             status_code=400
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _callback_url_template(redirect_uri: str) -> Tuple[str, str]:
+    """
+    Split a client redirect_uri into the text before and after the callback params.
+    
+    Any query the client already put on its redirect_uri is re-encoded into the
+    prefix and a fragment is kept in the suffix. Clients reuse the same
+    redirect_uri for every authorization, so this is cached and a request only
+    has to insert code and state.
+    """
+    parts = urlsplit(redirect_uri)
+    existing_query = urlencode(parse_qsl(parts.query, keep_blank_values=True))
+    base = urlunsplit(parts._replace(query="", fragment=""))
+    prefix = f"{base}?{existing_query}&" if existing_query else f"{base}?"
+    suffix = f"#{parts.fragment}" if parts.fragment else ""
+    return prefix, suffix
+
+
 async def authorize(request: Request):
     """Authorization endpoint - auto-approve and redirect to callback."""
-    query_params = dict(request.query_params)
-    
     # Generate authorization code
-    auth_code = f"mcp_tools_auth_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    auth_code = f"mcp_tools_auth_{secrets.token_urlsafe(16)}"
     
-    logger.info(f"Shell auth: Generated authorization code {auth_code} (AUTO-REDIRECT)")
+    logger.info("Shell auth: Generated authorization code %s (AUTO-REDIRECT)", auth_code)
     
-    state = query_params.get("state", "")
-    redirect_uri = query_params.get("redirect_uri", "")
+    state = request.query_params.get("state", "")
+    redirect_uri = request.query_params.get("redirect_uri", "")
     
     if redirect_uri:
-        # Build callback URL with auth code and state
-        callback_params = {
-            "code": auth_code,
-            "state": state
-        }
-        
-        callback_url = f"{redirect_uri}?{urlencode(callback_params)}"
+        # Build callback URL with auth code and state; the code is URL-safe by
+        # construction, only the client-supplied state needs quoting
+        prefix, suffix = _callback_url_template(redirect_uri)
+        callback_url = f"{prefix}code={auth_code}&state={quote_plus(state)}{suffix}"
         
-        logger.info(f"Shell auth: Redirecting to callback URL: {callback_url}")
+        logger.info("Shell auth: Redirecting to callback URL: %s", callback_url)
         
         # Return redirect response (critical for OAuth compliance)
         return RedirectResponse(url=callback_url, status_code=302)
     else:
         # Fallback: return JSON if no redirect_uri provided
         logger.warning("Shell auth: No redirect_uri provided, returning JSON response")
-        return JSONResponse({
+        return ORJSONResponse({
             "code": auth_code,
             "state": state,
             "authorization_granted": True,
@@ -138,27 +157,89 @@ async def authorize(request: Request):
         })
 
 
+# Token requests carry a handful of short fields; anything larger is rejected
+# before it is buffered or parsed
+_MAX_TOKEN_REQUEST_BYTES = 16 * 1024
+
+
+class _RequestTooLarge(Exception):
+    """Raised when a token request body exceeds _MAX_TOKEN_REQUEST_BYTES"""
+
+
+async def _replay_body(body: bytes) -> AsyncIterator[bytes]:
+    """Feed an already-read body to Starlette's multipart parser."""
+    yield body
+
+
+async def _read_token_request(request: Request) -> Dict[str, Any]:
+    """
+    Parse a token request body according to its content type.
+    
+    OAuth clients normally post application/x-www-form-urlencoded, which is parsed
+    directly with parse_qsl; JSON bodies are accepted as well, and an empty JSON
+    body is treated as {}. Starlette's multipart parser is only used for
+    multipart bodies. Every body, whatever its type, is read through the same
+    capped loop before it is parsed: bodies over _MAX_TOKEN_REQUEST_BYTES raise
+    _RequestTooLarge, checked against Content-Length up front and enforced while
+    streaming for requests that do not declare one.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > _MAX_TOKEN_REQUEST_BYTES:
+        raise _RequestTooLarge()
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > _MAX_TOKEN_REQUEST_BYTES:
+            raise _RequestTooLarge()
+    
+    content_type = request.headers.get("content-type", "")
+    
+    if content_type.startswith("multipart/form-data"):
+        form = await MultiPartParser(request.headers, _replay_body(bytes(body))).parse()
+        return dict(form)
+    
+    if content_type.startswith("application/json"):
+        return orjson.loads(body) if body else {}
+    
+    return dict(parse_qsl(body.decode()))
+
+
 async def token_endpoint(request: Request):
     """Token endpoint - issue access tokens."""
     try:
-        form_data = await request.form()
+        form_data = await _read_token_request(request)
         
         # Generate access token
-        access_token = f"mcp_tools_access_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        access_token = f"mcp_tools_access_{secrets.token_urlsafe(16)}"
         
-        logger.info(f"Shell auth: Issued access token {access_token}")
+        logger.info("Shell auth: Issued access token %s", access_token)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "access_token": access_token,
             "token_type": "Bearer",
             "expires_in": 3600,  # 1 hour
             "scope": "mcp",
-            "refresh_token": f"mcp_tools_refresh_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            "refresh_token": f"mcp_tools_refresh_{secrets.token_urlsafe(16)}"
         })
         
+    except _RequestTooLarge:
+        logger.warning("Token request rejected: body exceeds %s bytes", _MAX_TOKEN_REQUEST_BYTES)
+        return ORJSONResponse(
+            {"error": "invalid_request", "error_description": "Token request body too large"},
+            status_code=413
+        )
+        
+    except orjson.JSONDecodeError as e:
+        logger.warning("Token request rejected: malformed JSON body (%s)", e)
+        return ORJSONResponse(
+            {"error": "invalid_request", "error_description": "Malformed JSON body"},
+            status_code=400
+        )
+        
     except Exception as e:
-        logger.error(f"Token error: {e}")
-        return JSONResponse(
+        logger.error("Token error: %s", e)
+        return ORJSONResponse(
             {"error": "invalid_grant", "error_description": str(e)},
             status_code=400
         )
\ No newline at end of file
@@ -13,17 +13,27 @@ class Config:
     # Server configuration
     DEFAULT_PORT = int(os.getenv("MCP_SERVER_PORT", "8002"))
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    KEEP_ALIVE_TIMEOUT = int(os.getenv("KEEP_ALIVE_TIMEOUT", "75"))  # seconds
+    SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", "4096"))
+    LIMIT_CONCURRENCY = int(os.getenv("LIMIT_CONCURRENCY", "1000"))
+    SERVER_WORKERS = int(os.getenv("MCP_WORKERS", "1"))
+    # All tools are stateless, so MCP requests need no server-side session
+    STATELESS_HTTP = os.getenv("MCP_STATELESS_HTTP", "true").lower() == "true"
+    # Answer MCP requests with plain JSON instead of SSE so large tool results
+    # can be gzipped; no tool streams progress or server-initiated messages
+    JSON_RESPONSE = os.getenv("MCP_JSON_RESPONSE", "true").lower() == "true"
     
     # Tool configuration
     TOOL_TIMEOUT = int(os.getenv("TOOL_TIMEOUT", "300"))  # 5 minutes
     RATE_LIMIT = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
+    GH_CACHE_TTL = int(os.getenv("GH_CACHE_TTL", "60"))  # seconds, 0 disables gh api --cache
     
     # Tool script paths
     PR_VIOLATIONS_SCRIPT = os.getenv("PR_VIOLATIONS_SCRIPT", "pr-violations-claude")
     CODE_REVIEW_SCRIPT = os.getenv("CODE_REVIEW_SCRIPT", "code-review-claude")
     
     # Default cloud ID for JIRA operations
-    JIRA_CLOUD_ID = "credify.atlassian.net"
+    JIRA_CLOUD_ID = os.getenv("ATLASSIAN_CLOUD_ID", "credify.atlassian.net")
     
     @classmethod
     def get_all(cls) -> Dict[str, Any]:
@@ -31,8 +41,15 @@ class Config:
         return {
             "port": cls.DEFAULT_PORT,
             "log_level": cls.LOG_LEVEL,
+            "keep_alive_timeout": cls.KEEP_ALIVE_TIMEOUT,
+            "server_backlog": cls.SERVER_BACKLOG,
+            "limit_concurrency": cls.LIMIT_CONCURRENCY,
+            "server_workers": cls.SERVER_WORKERS,
+            "stateless_http": cls.STATELESS_HTTP,
+            "json_response": cls.JSON_RESPONSE,
             "tool_timeout": cls.TOOL_TIMEOUT,
             "rate_limit": cls.RATE_LIMIT,
+            "gh_cache_ttl": cls.GH_CACHE_TTL,
             "pr_violations_script": cls.PR_VIOLATIONS_SCRIPT,
             "code_review_script": cls.CODE_REVIEW_SCRIPT,
             "jira_cloud_id": cls.JIRA_CLOUD_ID
@@ -15,21 +15,29 @@ Architecture:
 - uvicorn ASGI server for production deployment
 """
 
+import atexit
+import importlib.util
 import logging
+import queue
 import sys
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
+import orjson
 import uvicorn
 from fastmcp import FastMCP
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
-from starlette.routing import Route
+from starlette.responses import Response
+from starlette.routing import Mount, Route
 
 # Import our modular components
 from config.settings import Config
 from auth.oauth_shell import (
     oauth_authorization_server,
-    oauth_authorization_server_mcp,
     oauth_protected_resource,
     register_client,
     authorize,
@@ -37,88 +45,196 @@ from auth.oauth_shell import (
 )
 from tools import register_all_tools, get_all_tool_descriptions
 
-# Configure logging
+# Configure logging: request handlers only enqueue records, a background
+# listener thread does the formatting and stream writes
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_queue = queue.SimpleQueue()
+# QueueHandler.prepare() formats the message before enqueueing; keep that to
+# the bare message so the listener's formatter is applied only once
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=getattr(logging, Config.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    handlers=[_log_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize tool results with orjson, falling back to str() like FastMCP's default"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("MCP Tools Server")
+mcp = FastMCP("MCP Tools Server", tool_serializer=_serialize_tool_result)
+
+
+# Shell authentication routes for Claude Code compatibility. The handlers are
+# module-level, so the routes are built once at import.
+_AUTH_ROUTES = (
+    Mount('/.well-known', routes=[
+        Route('/oauth-authorization-server', oauth_authorization_server, methods=['GET']),
+        Route('/oauth-authorization-server/mcp', oauth_authorization_server, methods=['GET']),
+        Route('/oauth-authorization-server-mcp', oauth_authorization_server, methods=['GET']),
+        Route('/oauth-protected-resource', oauth_protected_resource, methods=['GET']),
+    ]),
+    Route('/register', register_client, methods=['POST']),
+    Route('/auth', authorize, methods=['GET']),
+    Route('/token', token_endpoint, methods=['POST']),
+)
+
+# Liveness probes only need a 200, so /livez answers with one shared,
+# pre-built response and does no work per request
+_LIVENESS_RESPONSE = Response(b"ok", media_type="text/plain")
+
+
+async def liveness_check(request: Request):
+    return _LIVENESS_RESPONSE
+
+
+# /health is probed constantly; its timestamp only needs one-second resolution
+_health_time = {"second": -1, "json": b""}
+
+# Stands in for the timestamp when the /health body is pre-rendered
+_HEALTH_TIMESTAMP_PLACEHOLDER = "__health_timestamp__"
+
+
+def _health_timestamp_json() -> bytes:
+    """Return the JSON-encoded ISO timestamp for /health, re-formatted at most once per second."""
+    now = time.time()
+    if int(now) != _health_time["second"]:
+        _health_time["second"] = int(now)
+        _health_time["json"] = orjson.dumps(datetime.fromtimestamp(now).isoformat())
+    return _health_time["json"]
+
+
+def create_app():
+    """
+    Register all tools and build the HTTP app with the shell auth routes.
+    
+    Used directly for a single process, and as the uvicorn app factory when
+    running multiple workers so each worker process builds its own app.
+    """
+    # Register all tools using the modular system
+    logger.info("Registering tools using modular architecture...")
+    registration_result = register_all_tools(mcp)
+    
+    # Log registration results
+    if registration_result["status"] == "completed":
+        logger.info("All tools registered successfully: %s modules", registration_result['successful_registrations'])
+    else:
+        logger.warning("Tool registration completed with errors: %s failed", registration_result['failed_registrations'])
+    
+    # Get the FastAPI app from FastMCP. Stateless mode skips the per-session
+    # transport and session-id bookkeeping; MCP sessions live in process memory,
+    # so several workers always need it. Tool results are answered as plain
+    # JSON rather than SSE, because GZipMiddleware never compresses
+    # text/event-stream; JSON bodies over 1 KB (tool results, /health) are
+    # gzipped.
+    app = mcp.http_app(
+        middleware=[Middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)],
+        json_response=Config.JSON_RESPONSE,
+        stateless_http=Config.STATELESS_HTTP or Config.SERVER_WORKERS > 1
+    )
+    
+    # Health endpoint for container health checks. Everything except the
+    # timestamp is fixed once tools are registered, so the body is rendered
+    # here once and split around the timestamp.
+    tool_descriptions = get_all_tool_descriptions()
+    health_payload = {
+        "status": "healthy",
+        "service": "mcp-tools",
+        "version": "2.0.1",
+        "architecture": "modular",
+        "transport": "FastMCP HTTP Streaming",
+        "timestamp": _HEALTH_TIMESTAMP_PLACEHOLDER,
+        "port": Config.DEFAULT_PORT,
+        "tools": {
+            "available": list(tool_descriptions.keys()),
+            "count": len(tool_descriptions),
+            "descriptions": tool_descriptions
+        },
+        "registration": {
+            "status": registration_result["status"],
+            "successful": registration_result["successful_registrations"],
+            "failed": registration_result["failed_registrations"],
+            "total": registration_result["total_modules"]
+        }
+    }
+    
+    health_prefix, health_suffix = orjson.dumps(health_payload).split(
+        orjson.dumps(_HEALTH_TIMESTAMP_PLACEHOLDER)
+    )
+    
+    async def health_check(request: Request):
+        return Response(health_prefix + _health_timestamp_json() + health_suffix, media_type="application/json")
+    
+    # Add health, liveness and shell authentication routes
+    app.routes.extend((
+        Route('/health', health_check, methods=['GET']),
+        Route('/livez', liveness_check, methods=['GET']),
+        *_AUTH_ROUTES
+    ))
+    
+    logger.info("FastMCP HTTP Streaming server initialized with shell authentication")
+    logger.info("Available tools: %s", ', '.join(tool_descriptions.keys()))
+    logger.info("Authentication endpoints: /.well-known/oauth-authorization-server, /register, /auth, /token")
+    
+    return app
 
 
 def main():
     """Main function to start the MCP Tools server"""
     logger.info("Starting MCP Tools Server (Modular Architecture)...")
-    logger.info(f"Server configuration: Port {Config.DEFAULT_PORT}, Log Level {Config.LOG_LEVEL}")
+    logger.info("Server configuration: Port %s, Log Level %s, Workers %s", Config.DEFAULT_PORT, Config.LOG_LEVEL, Config.SERVER_WORKERS)
     
     try:
-        # Register all tools using the modular system
-        logger.info("Registering tools using modular architecture...")
-        registration_result = register_all_tools(mcp)
+        # loop/http "auto" pick uvloop/httptools (declared dependencies) and fall
+        # back to asyncio/h11 where they cannot be installed
+        if importlib.util.find_spec("uvloop") is None:
+            logger.warning("uvloop is not installed; serving on the stdlib asyncio event loop")
+        if importlib.util.find_spec("httptools") is None:
+            logger.warning("httptools is not installed; parsing HTTP with h11")
         
-        # Log registration results
-        if registration_result["status"] == "completed":
-            logger.info(f"All tools registered successfully: {registration_result['successful_registrations']} modules")
-        else:
-            logger.warning(f"Tool registration completed with errors: {registration_result['failed_registrations']} failed")
-        
-        # Get the FastAPI app from FastMCP
-        app = mcp.http_app()
-        
-        # Health endpoint for container health checks
-        async def health_check(request: Request):
-            tool_descriptions = get_all_tool_descriptions()
-            return JSONResponse({
-                "status": "healthy",
-                "service": "mcp-tools",
-                "version": "2.0.1",
-                "architecture": "modular",
-                "transport": "FastMCP HTTP Streaming",
-                "timestamp": datetime.now().isoformat(),
-                "port": Config.DEFAULT_PORT,
-                "tools": {
-                    "available": list(tool_descriptions.keys()),
-                    "count": len(tool_descriptions),
-                    "descriptions": tool_descriptions
-                },
-                "registration": {
-                    "status": registration_result["status"],
-                    "successful": registration_result["successful_registrations"],
-                    "failed": registration_result["failed_registrations"],
-                    "total": registration_result["total_modules"]
-                }
-            })
-        
-        # Add shell authentication routes for Claude Code compatibility
-        auth_routes = [
-            Route('/health', health_check, methods=['GET']),
-            Route('/.well-known/oauth-authorization-server', oauth_authorization_server, methods=['GET']),
-            Route('/.well-known/oauth-authorization-server-mcp', oauth_authorization_server_mcp, methods=['GET']),
-            Route('/.well-known/oauth-protected-resource', oauth_protected_resource, methods=['GET']),
-            Route('/register', register_client, methods=['POST']),
-            Route('/auth', authorize, methods=['GET']),
-            Route('/token', token_endpoint, methods=['POST']),
-        ]
-        
-        for route in auth_routes:
-            app.routes.append(route)
-        
-        logger.info("FastMCP HTTP Streaming server initialized with shell authentication")
-        logger.info(f"Available tools: {', '.join(get_all_tool_descriptions().keys())}")
-        logger.info("Authentication endpoints: /.well-known/oauth-authorization-server, /register, /auth, /token")
-        
-        # Run with uvicorn
-        uvicorn.run(
-            app,
+        server_options = dict(
             host="0.0.0.0",
             port=Config.DEFAULT_PORT,
-            log_level=Config.LOG_LEVEL.lower()
+            loop="auto",
+            http="auto",
+            ws="none",
+            # FastMCP's app starts its streamable-HTTP session manager in the
+            # lifespan, so it must run; "on" makes a failed startup fatal
+            lifespan="on",
+            log_level=Config.LOG_LEVEL.lower(),
+            access_log=False,
+            # Nothing reads the client address or X-Forwarded-* headers
+            proxy_headers=False,
+            timeout_keep_alive=Config.KEEP_ALIVE_TIMEOUT,
+            backlog=Config.SERVER_BACKLOG,
+            limit_concurrency=Config.LIMIT_CONCURRENCY
         )
         
+        if Config.SERVER_WORKERS > 1:
+            # Workers are separate processes, so uvicorn needs an import string
+            uvicorn.run(
+                "mcp_tools_server:create_app",
+                factory=True,
+                workers=Config.SERVER_WORKERS,
+                **server_options
+            )
+        else:
+            server_config = uvicorn.Config(create_app(), **server_options)
+            uvicorn.Server(server_config).run()
+        
     except Exception as e:
-        logger.error(f"Failed to start MCP Tools server: {e}")
+        logger.error("Failed to start MCP Tools server: %s", e)
         sys.exit(1)
 
 
@@ -10,11 +10,31 @@ import logging
 from typing import List, Dict, Any
 
 from fastmcp import FastMCP
-from .reports import register_all_report_tools, get_report_tool_descriptions
-from .work import register_all_work_tools, get_work_tool_descriptions
+from .reports import register_all_report_tools, REPORT_TOOL_DESCRIPTIONS
+from .work import register_all_work_tools, WORK_TOOL_DESCRIPTIONS
 
 logger = logging.getLogger(__name__)
 
+# Tool names expected after registration, and the merged descriptions of both
+# categories; built once and shared, so do not mutate
+TOOL_LIST = [
+    "pr_violations",
+    "code_review", 
+    "tech_design_review",
+    "jira_transition",
+    "get_jira_transitions",
+    "quarterly_team_report",
+    "quarter_over_quarter_analysis",
+    "personal_quarterly_report",
+    "personal_quarter_over_quarter",
+    "setup_prerequisites",
+    "check_tool_requirements",
+    "echo",
+    "get_system_info"
+]
+
+ALL_TOOL_DESCRIPTIONS = {**REPORT_TOOL_DESCRIPTIONS, **WORK_TOOL_DESCRIPTIONS}
+
 
 def register_all_tools(mcp: FastMCP) -> Dict[str, Any]:
     """
@@ -46,14 +66,14 @@ def register_all_tools(mcp: FastMCP) -> Dict[str, Any]:
     all_registered_tools = report_results["registered_tools"] + work_results["registered_tools"]
     all_errors = report_results["registration_errors"] + work_results["registration_errors"]
     
-    logger.info(f"Modular tool registration complete: {total_successful}/{total_modules} modules successful")
-    logger.info(f"  - Reports: {report_results['successful_registrations']} tools")
-    logger.info(f"  - Work Tools: {work_results['successful_registrations']} tools")
+    logger.info("Modular tool registration complete: %s/%s modules successful", total_successful, total_modules)
+    logger.info("  - Reports: %s tools", report_results['successful_registrations'])
+    logger.info("  - Work Tools: %s tools", work_results['successful_registrations'])
     
     if all_errors:
-        logger.warning(f"Registration errors occurred in {total_failed} modules")
+        logger.warning("Registration errors occurred in %s modules", total_failed)
         for error in all_errors:
-            logger.warning(f"  - {error['module']}: {error['status']} - {error['error']}")
+            logger.warning("  - %s: %s - %s", error['module'], error['status'], error['error'])
     
     return {
         "architecture": "modular",
@@ -66,8 +86,8 @@ def register_all_tools(mcp: FastMCP) -> Dict[str, Any]:
         "failed_registrations": total_failed,
         "registered_tools": all_registered_tools,
         "registration_errors": all_errors,
-        "available_tools": get_tool_list(),
-        "tool_descriptions": get_all_tool_descriptions(),
+        "available_tools": TOOL_LIST,
+        "tool_descriptions": ALL_TOOL_DESCRIPTIONS,
         "status": "completed" if total_failed == 0 else "completed_with_errors"
     }
 
@@ -79,21 +99,7 @@ def get_tool_list() -> List[str]:
     Returns:
         List of tool names that should be available after registration
     """
-    return [
-        "pr_violations",
-        "code_review", 
-        "tech_design_review",
-        "jira_transition",
-        "get_jira_transitions",
-        "quarterly_team_report",
-        "quarter_over_quarter_analysis",
-        "personal_quarterly_report",
-        "personal_quarter_over_quarter",
-        "setup_prerequisites",
-        "check_tool_requirements",
-        "echo",
-        "get_system_info"
-    ]
+    return TOOL_LIST
 
 
 def get_all_tool_descriptions() -> Dict[str, str]:
@@ -103,7 +109,4 @@ def get_all_tool_descriptions() -> Dict[str, str]:
     Returns:
         Dictionary mapping tool names to their descriptions
     """
-    descriptions = {}
-    descriptions.update(get_report_tool_descriptions())
-    descriptions.update(get_work_tool_descriptions())
-    return descriptions
\ No newline at end of file
+    return ALL_TOOL_DESCRIPTIONS
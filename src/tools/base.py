@@ -3,7 +3,9 @@
 Base utilities for MCP tools
 """
 
+import functools
 import logging
+import os
 import re
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
@@ -11,6 +13,16 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used on every PR-URL validation / ticket lookup
+_GITHUB_PR_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/pull/([0-9]+)')
+_JIRA_TICKET_PATTERN = re.compile(r'SI-\d+', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_context_file(context_file: str, mtime_ns: int) -> str:
+    """Read a context file; the mtime in the cache key invalidates it on edit"""
+    return Path(context_file).read_text()
+
 
 class ToolBase:
     """Base class for MCP tools with common utilities"""
@@ -23,10 +35,7 @@ class ToolBase:
         Returns:
             Tuple of (is_valid, components_dict or None)
         """
-        if not pr_url.startswith("https://github.com/") or "/pull/" not in pr_url:
-            return False, None
-        
-        url_match = re.match(r'https://github\.com/([^/]+)/([^/]+)/pull/([0-9]+)', pr_url)
+        url_match = _GITHUB_PR_URL_PATTERN.match(pr_url)
         if not url_match:
             return False, None
         
@@ -40,18 +49,18 @@ class ToolBase:
     @staticmethod
     def extract_jira_ticket(text: str) -> Optional[str]:
         """Extract JIRA ticket ID from text using regex pattern SI-XXXX"""
-        match = re.search(r'SI-\d+', text, re.IGNORECASE)
+        match = _JIRA_TICKET_PATTERN.search(text)
         return match.group() if match else None
     
     @staticmethod
     def load_external_context(context_file: str, fallback_content: str = "") -> str:
         """Load external context file with fallback"""
         try:
-            context_path = Path(context_file)
-            if context_path.exists():
-                return context_path.read_text()
+            return _read_context_file(context_file, os.stat(context_file).st_mtime_ns)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.warning(f"Failed to load context file {context_file}: {e}")
+            logger.warning("Failed to load context file %s: %s", context_file, e)
         
         return fallback_content
     
@@ -81,11 +90,9 @@ class ToolBase:
         return {**base_response, **data}
 
 
-def get_context_fallback(context_type: str) -> str:
-    """Get fallback context content for different tool types"""
-    
-    fallbacks = {
-        "pr_violations": """# PR Violations Analysis Guidelines
+# Fallback context per tool type, used when the external context file is missing
+_CONTEXT_FALLBACKS = {
+    "pr_violations": """# PR Violations Analysis Guidelines
 
 ## Review Thread Analysis
 - Focus on open threads (not resolved, collapsed, or outdated)
@@ -114,8 +121,8 @@ Violation Summary:
 - **B**: Adequate analysis, some areas need attention
 - **C**: Basic analysis, significant improvements needed
 """,
-        
-        "code_review": """# Code Review Guidelines
+    
+    "code_review": """# Code Review Guidelines
 
 ## Comprehensive Assessment Areas
 
@@ -157,8 +164,8 @@ Violation Summary:
 - **REQUEST CHANGES**: Critical issues that block merge
 - **COMMENT**: Quality suggestions but no blockers
 """,
-        
-        "tech_design_review": """# Tech Design Review Framework
+    
+    "tech_design_review": """# Tech Design Review Framework
 
 ## Review Phases
 
@@ -212,6 +219,9 @@ Violation Summary:
 - **Grade C/D**: Significant gaps, major revisions required
 - **Grade F**: Fundamental issues, complete rework needed
 """
-    }
-    
-    return fallbacks.get(context_type, "")
\ No newline at end of file
+}
+
+
+def get_context_fallback(context_type: str) -> str:
+    """Get fallback context content for different tool types"""
+    return _CONTEXT_FALLBACKS.get(context_type, "")
\ No newline at end of file
@@ -6,13 +6,25 @@ Analytics and performance reporting tools for team and personal development trac
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Tuple
 
 from fastmcp import FastMCP
+from .quarterly_report import register_quarterly_team_report_tool
+from .quarter_over_quarter import register_quarter_over_quarter_tool
+from .personal_performance import register_personal_performance_tools
 
 logger = logging.getLogger(__name__)
 
 
+# Descriptions of the reporting tools; built once and shared, so do not mutate
+REPORT_TOOL_DESCRIPTIONS = {
+    "quarterly_team_report": "Generate comprehensive quarterly team performance reports with anonymized metrics",
+    "quarter_over_quarter_analysis": "Analyze team performance trends and size changes across multiple quarters",
+    "personal_quarterly_report": "Generate individual contributor performance report for a single quarter",
+    "personal_quarter_over_quarter": "Analyze personal performance trends and growth across multiple quarters"
+}
+
+
 def register_all_report_tools(mcp: FastMCP) -> Dict[str, Any]:
     """
     Register all reporting tools with the FastMCP server.
@@ -26,43 +38,37 @@ def register_all_report_tools(mcp: FastMCP) -> Dict[str, Any]:
     registered_tools = []
     registration_errors = []
     
-    # List of reporting tool modules to register
-    report_modules = [
-        ("quarterly_report", "register_quarterly_team_report_tool"),
-        ("quarter_over_quarter", "register_quarter_over_quarter_tool"),
-        ("personal_performance", "register_personal_performance_tools")
+    # Reporting tool modules and their registration functions, imported at module load
+    report_modules: List[Tuple[str, Callable[[FastMCP], Any]]] = [
+        ("quarterly_report", register_quarterly_team_report_tool),
+        ("quarter_over_quarter", register_quarter_over_quarter_tool),
+        ("personal_performance", register_personal_performance_tools)
     ]
     
     logger.info("Starting report tools registration...")
     
-    for module_name, register_function_name in report_modules:
+    for module_name, register_function in report_modules:
         try:
-            # Dynamic import of report tool module
-            module = __import__(f"tools.reports.{module_name}", fromlist=[register_function_name])
-            
-            # Get the registration function
-            register_function = getattr(module, register_function_name)
-            
             # Call the registration function
             register_function(mcp)
             
             registered_tools.append({
                 "module": f"reports.{module_name}",
-                "register_function": register_function_name,
+                "register_function": register_function.__name__,
                 "status": "success"
             })
             
-            logger.info(f"Successfully registered report tools from: reports.{module_name}")
+            logger.info("Successfully registered report tools from: reports.%s", module_name)
             
         except Exception as e:
             error_info = {
                 "module": f"reports.{module_name}",
-                "register_function": register_function_name,
+                "register_function": register_function.__name__,
                 "status": "error",
                 "error": str(e)
             }
             registration_errors.append(error_info)
-            logger.error(f"Error registering report tools from {module_name}: {e}")
+            logger.error("Error registering report tools from %s: %s", module_name, e)
     
     return {
         "category": "reports",
@@ -80,9 +86,4 @@ def get_report_tool_descriptions() -> Dict[str, str]:
     Returns:
         Dictionary mapping tool names to their descriptions
     """
-    return {
-        "quarterly_team_report": "Generate comprehensive quarterly team performance reports with anonymized metrics",
-        "quarter_over_quarter_analysis": "Analyze team performance trends and size changes across multiple quarters",
-        "personal_quarterly_report": "Generate individual contributor performance report for a single quarter",
-        "personal_quarter_over_quarter": "Analyze personal performance trends and growth across multiple quarters"
-    }
\ No newline at end of file
+    return REPORT_TOOL_DESCRIPTIONS
@@ -19,6 +19,8 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 
+from config.settings import Config
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,10 +71,10 @@ class JiraGithubReportCoordinator:
                 "Execute: git config --global user.name",
                 "Execute: git config --global user.email", 
                 "Execute: gh api user --jq '.login'",
-                "Execute: mcp__atlassian__lookupJiraAccountId(cloudId='credify.atlassian.net', searchString='{user_email}')",
+                f"Execute: mcp__atlassian__lookupJiraAccountId(cloudId='{Config.JIRA_CLOUD_ID}', searchString='{{user_email}}')",
                 "",
                 "## JIRA Ticket Collection",
-                f"Execute: mcp__atlassian__searchJiraIssuesUsingJql(cloudId='credify.atlassian.net', jql='{jira_query}', fields=['summary', 'description', 'status', 'issuetype', 'priority', 'created', 'assignee', 'components', 'timeoriginalestimate', 'timespent', 'comment'], maxResults=500)",
+                f"Execute: mcp__atlassian__searchJiraIssuesUsingJql(cloudId='{Config.JIRA_CLOUD_ID}', jql='{jira_query}', fields=['summary', 'description', 'status', 'issuetype', 'priority', 'created', 'assignee', 'components', 'timeoriginalestimate', 'timespent', 'comment'], maxResults=500)",
                 "",
                 "## PR Link Extraction from JIRA",
                 "# Parse ticket descriptions and comments for GitHub PR URLs",
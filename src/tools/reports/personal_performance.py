@@ -20,6 +20,7 @@ from typing import Dict, Any, List
 
 from fastmcp import FastMCP
 from .base import ToolBase, get_context_fallback
+from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +39,10 @@ class PersonalPerformanceCoordinator:
                 "Execute: git config --global user.name",
                 "Execute: git config --global user.email", 
                 "Execute: gh api user --jq '.login'",
-                "Execute: mcp__atlassian__lookupJiraAccountId(cloudId='credify.atlassian.net', searchString='{user_email}')",
+                f"Execute: mcp__atlassian__lookupJiraAccountId(cloudId='{Config.JIRA_CLOUD_ID}', searchString='{{user_email}}')",
                 "",
                 "## Personal JIRA Ticket Collection",
-                f"Execute: mcp__atlassian__searchJiraIssuesUsingJql(cloudId='credify.atlassian.net', jql='project = \"{team_prefix}\" AND assignee = \"{{user_account_id}}\" AND created >= \"{start_date}\" AND created <= \"{end_date}\" ORDER BY created DESC', fields=['summary', 'description', 'status', 'issuetype', 'priority', 'created', 'assignee', 'components', 'timeoriginalestimate', 'timespent', 'comment'], maxResults=250)",
+                f"Execute: mcp__atlassian__searchJiraIssuesUsingJql(cloudId='{Config.JIRA_CLOUD_ID}', jql='project = \"{team_prefix}\" AND assignee = \"{{user_account_id}}\" AND created >= \"{start_date}\" AND created <= \"{end_date}\" ORDER BY created DESC', fields=['summary', 'description', 'status', 'issuetype', 'priority', 'created', 'assignee', 'components', 'timeoriginalestimate', 'timespent', 'comment'], maxResults=250)",
                 "",
                 "## PR Link Extraction from JIRA",
                 "# Parse ticket descriptions and comments for GitHub PR URLs",
@@ -187,7 +188,7 @@ def register_personal_performance_tools(mcp: FastMCP):
         Returns:
             Dictionary containing detailed processing instructions for Claude Code execution
         """
-        logger.info(f"Personal quarterly report requested: {team_prefix} Q{quarter} {year}")
+        logger.info("Personal quarterly report requested: %s Q%s %s", team_prefix, quarter, year)
         
         try:
             # Validate inputs
@@ -471,11 +472,11 @@ Based on personal JIRA tickets and GitHub commits:
                 }
             }
             
-            logger.info(f"Enhanced personal quarterly report with 3-subagent coordination generated for: {quarter_name}")
+            logger.info("Enhanced personal quarterly report with 3-subagent coordination generated for: %s", quarter_name)
             return personal_instructions
             
         except Exception as e:
-            logger.error(f"Error generating enhanced personal quarterly report instructions: {str(e)}")
+            logger.error("Error generating enhanced personal quarterly report instructions: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to generate enhanced personal quarterly report instructions: {str(e)}",
                 error_type=type(e).__name__
@@ -522,7 +523,7 @@ Based on personal JIRA tickets and GitHub commits:
         Returns:
             Dictionary containing detailed processing instructions for Claude Code execution
         """
-        logger.info(f"Personal quarter-over-quarter analysis requested: {team_prefix} {period}")
+        logger.info("Personal quarter-over-quarter analysis requested: %s %s", team_prefix, period)
         
         try:
             # Validate inputs
@@ -593,7 +594,7 @@ Based on personal JIRA tickets and GitHub commits:
                         "Execute: git config --global user.name",
                         "Execute: git config --global user.email", 
                         "Execute: gh api user --jq '.login'",
-                        "Execute: mcp__atlassian__lookupJiraAccountId(cloudId='credify.atlassian.net', searchString='{{user_email}}')",
+                        f"Execute: mcp__atlassian__lookupJiraAccountId(cloudId='{Config.JIRA_CLOUD_ID}', searchString='{{{{user_email}}}}')",
                         "",
                         "## Quarter-by-Quarter Data Collection",
                         "For each quarter in the analysis period:",
@@ -777,11 +778,11 @@ Based on personal JIRA tickets and GitHub commits:
                 }
             }
             
-            logger.info(f"Personal quarter-over-quarter instructions generated for: {period}")
+            logger.info("Personal quarter-over-quarter instructions generated for: %s", period)
             return qoq_instructions
             
         except Exception as e:
-            logger.error(f"Error generating personal quarter-over-quarter instructions: {str(e)}")
+            logger.error("Error generating personal quarter-over-quarter instructions: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to generate personal quarter-over-quarter instructions: {str(e)}",
                 error_type=type(e).__name__
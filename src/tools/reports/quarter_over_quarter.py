@@ -18,6 +18,7 @@ from typing import Dict, Any, List
 from fastmcp import FastMCP
 from .base import ToolBase
 from .coordinator import JiraGithubReportCoordinator
+from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +68,7 @@ def register_quarter_over_quarter_tool(mcp: FastMCP):
         Returns:
             Dictionary containing detailed processing instructions for Claude Code execution
         """
-        logger.info(f"Quarter-over-quarter analysis requested: {team_prefix} {period}")
+        logger.info("Quarter-over-quarter analysis requested: %s %s", team_prefix, period)
         
         try:
             # Validate inputs
@@ -240,7 +241,7 @@ def register_quarter_over_quarter_tool(mcp: FastMCP):
                     "quarter_data_collection_template": [
                         "### {quarter_name} Data Collection",
                         "# JIRA Data for {quarter_name}",
-                        "Execute: mcp__atlassian__searchJiraIssuesUsingJql(cloudId='credify.atlassian.net', jql='project = \\\"{team_prefix}\\\" AND created >= \\\"{start_date}\\\" AND created <= \\\"{end_date}\\\" ORDER BY created DESC', fields=['summary', 'description', 'status', 'issuetype', 'priority', 'created', 'assignee', 'components'], maxResults=250)",
+                        f"Execute: mcp__atlassian__searchJiraIssuesUsingJql(cloudId='{Config.JIRA_CLOUD_ID}', jql='project = \\\"{{team_prefix}}\\\" AND created >= \\\"{{start_date}}\\\" AND created <= \\\"{{end_date}}\\\" ORDER BY created DESC', fields=['summary', 'description', 'status', 'issuetype', 'priority', 'created', 'assignee', 'components'], maxResults=250)",
                         "",
                         "# GitHub Data for {quarter_name}",
                         "Execute: gh search repos 'org:credify topic:{team_prefix_lower} OR {team_prefix_lower} in:name' --json name,url,defaultBranch",
@@ -444,11 +445,11 @@ def register_quarter_over_quarter_tool(mcp: FastMCP):
                 }
             }
             
-            logger.info(f"Quarter-over-quarter analysis instructions generated for: {team_prefix} {period}")
+            logger.info("Quarter-over-quarter analysis instructions generated for: %s %s", team_prefix, period)
             return qoq_instructions
             
         except Exception as e:
-            logger.error(f"Error generating quarter-over-quarter analysis instructions: {str(e)}")
+            logger.error("Error generating quarter-over-quarter analysis instructions: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to generate quarter-over-quarter analysis instructions: {str(e)}",
                 error_type=type(e).__name__
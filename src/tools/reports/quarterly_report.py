@@ -62,7 +62,7 @@ def register_quarterly_team_report_tool(mcp: FastMCP):
         Returns:
             Comprehensive team analysis instructions with JIRA MCP and GitHub CLI commands
         """
-        logger.info(f"Quarterly team report requested: {team_prefix} Q{quarter} {year}")
+        logger.info("Quarterly team report requested: %s Q%s %s", team_prefix, quarter, year)
         
         try:
             # Validate inputs
@@ -378,11 +378,11 @@ Based on JIRA ticket summaries and GitHub commit messages:
                 }
             }
             
-            logger.info(f"Quarterly team report instructions generated for: {team_prefix} Q{quarter} {year}")
+            logger.info("Quarterly team report instructions generated for: %s Q%s %s", team_prefix, quarter, year)
             return quarterly_instructions
             
         except Exception as e:
-            logger.error(f"Error generating quarterly team report instructions: {str(e)}")
+            logger.error("Error generating quarterly team report instructions: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to generate quarterly team report instructions: {str(e)}",
                 error_type=type(e).__name__
@@ -7,97 +7,24 @@ Provides step-by-step instructions for external agents to analyze code quality,
 security, performance, and maintainability aspects.
 """
 
+import functools
 import logging
+from datetime import datetime
 from typing import Dict, Any
 
 from fastmcp import FastMCP
-from .base import ToolBase, get_context_fallback
+from .base import GH_CACHE_ARG, GH_FILES_CACHE_ARG, ToolBase, get_context_fallback
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# External context file; re-read only when its mtime changes
+_CONTEXT_FILE = "/Users/dlighty/code/llm-context/CODE-REVIEW-CONTEXT.md"
 
-def register_code_review_tool(mcp: FastMCP):
-    """Register the code_review tool with the FastMCP server"""
-    
-    @mcp.tool
-    def code_review(pr_url: str, focus: str = "", max_diff_lines: int = 2000) -> Dict[str, Any]:
-        """
-        Comprehensive code quality review of pull requests - ANALYSIS INSTRUCTIONS ONLY.
-        
-        **Natural Language Triggers:**
-        - "code review [PR_URL]"
-        - "review this PR [PR_URL]" 
-        - "analyze code quality in [PR_URL]"
-        - "check code standards [PR_URL]"
-        - "security review [PR_URL]"
-        - "performance review [PR_URL]"
-        - "review pr for [focus] [PR_URL]"
-        
-        **What this tool does:**
-        Returns comprehensive instructions for analyzing code quality, security, performance, and 
-        maintainability. Focuses on deep code analysis, standards compliance, and identifying 
-        improvement opportunities. Does NOT execute review - provides detailed analysis framework.
-        
-        **Perfect for:** Code quality assessment, security audits, performance optimization, 
-        standards compliance checking, mentoring feedback, pre-merge review.
-        
-        Args:
-            pr_url: GitHub PR URL to review (e.g., https://github.com/owner/repo/pull/123)
-            focus: Optional focus area ("security", "performance", "tests", "maintainability")
-            max_diff_lines: Maximum diff lines to analyze (default: 2000)
-            
-        Returns:
-            Detailed instructions for Claude Code to perform comprehensive code review
-        """
-        logger.info(f"code_review tool called for: {pr_url}")
-        
-        try:
-            # Validate PR URL format
-            is_valid, components = ToolBase.validate_github_pr_url(pr_url)
-            if not is_valid:
-                return ToolBase.create_error_response(
-                    "Invalid GitHub PR URL format",
-                    pr_url,
-                    "validation_error"
-                )
-            
-            owner = components["owner"]
-            repo = components["repo"]
-            pr_number = components["pr_number"]
-            
-            # Load external context file
-            context_content = ToolBase.load_external_context(
-                "/Users/dlighty/code/llm-context/CODE-REVIEW-CONTEXT.md",
-                get_context_fallback("code_review")
-            )
-            
-            # Return detailed analysis instructions
-            comprehensive_review = {
-                "tool_name": "code_review",
-                "analysis_context": "Comprehensive PR Code Review - Generate Structured Analysis",
-                "timestamp": ToolBase.create_success_response({})["timestamp"],
-                "pr_url": pr_url,
-                "pr_owner": owner,
-                "pr_repo": repo,
-                "pr_number": pr_number,
-                "focus": focus,
-                "max_diff_lines": max_diff_lines,
-                
-                "processing_instructions": {
-                    "overview": f"Extract PR data and generate comprehensive ANALYSIS-ONLY code review in structured format. Focus: {focus or 'comprehensive quality assessment'}. Apply deep thinking about simplification opportunities and standards compliance.",
-                    
-                    "data_extraction_steps": [
-                        f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}\" (PR details)",
-                        f"Execute: gh pr diff {pr_number} --repo {owner}/{repo} | head -n {max_diff_lines} (code changes)",
-                        f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/files\" (files changed)",
-                        f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/commits\" | jq -r '.[].sha' | tail -1 | xargs -I {{}} gh api \"repos/{owner}/{repo}/commits/{{}}/check-runs\" (CI status)",
-                        f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/reviews\" (existing reviews)",
-                        "Extract JIRA ticket from PR title/body (SI-XXXX pattern)",
-                        "If JIRA ticket found, execute: mcp__atlassian__getJiraIssue(cloudId='credify.atlassian.net', issueIdOrKey='TICKET_ID', fields=['summary', 'description', 'status', 'assignee', 'priority']) to get ticket details for compliance analysis"
-                    ],
-                    
-                    "required_output_format": """
+# Static parts of the code_review instructions, built once at import. The
+# markdown template keeps its [PLACEHOLDER] markers: they are filled in by the
+# agent executing the review, not by this server.
+_REVIEW_OUTPUT_FORMAT = """
 # 🔍 **Code Review Analysis: [PR_TITLE]**
 
 **Repository**: [OWNER]/[REPO] #[NUMBER]  
@@ -222,55 +149,159 @@ def register_code_review_tool(mcp: FastMCP):
 ---
 
 *Review completed with deep analysis of code simplification opportunities and standards compliance.*
-""",
-                    
-                    "analysis_requirements": [
-                        "CRITICAL: Generate analysis in the EXACT format above",
-                        "Use actual PR data (title, files, lines) - no placeholders",
-                        "Focus on ANALYSIS ONLY - no code changes or implementations",
-                        "Apply deep thinking about simplification opportunities",
-                        "Extract JIRA ticket ID from PR title/body using regex pattern: SI-\\d+",
-                        "If JIRA ticket found, execute Atlassian MCP command to retrieve ticket details",
-                        "Use JIRA ticket data (summary, description, status, assignee, priority) for compliance analysis",
-                        "Assess whether implementation matches JIRA ticket requirements based on retrieved data",
-                        "Provide specific file:line references for all findings",
-                        "Ensure all sections are completed with actual analysis",
-                        "Replace ALL bracketed placeholders with real data/analysis",
-                        "Include JIRA integration status in analysis even if ticket not found"
-                    ]
-                },
-                
-                "quality_standards": {
-                    "focus_areas": [
-                        "Code Simplification: Could this be simpler? Are there unnecessary complexities?",
-                        "Standards Compliance: Does this follow established patterns and quality standards?",
-                        "Architectural Coherence: Does this fit well with existing design patterns?",
-                        "Business Logic Alignment: Do the changes properly match the ticket specification?",
-                        "Test Strategy: Are tests comprehensive and following best practices?"
-                    ],
-                    "assessment_depth": "Comprehensive analysis covering violations, quality, tests, security, business logic, and JIRA compliance",
-                    "output_specificity": "All findings must include specific file:line references and actionable solutions"
-                },
-                
-                "external_context": context_content,
-                
-                "success_criteria": {
-                    "format_compliance": "Output matches the required structured format exactly",
-                    "data_accuracy": "All PR information extracted successfully with real file:line references",
-                    "analysis_completeness": "All sections completed with thorough analysis (no placeholders remaining)",
-                    "actionable_output": "Specific, thoughtful recommendations provided (analysis only, no code changes)",
-                    "deep_insights": "Meaningful assessment of code simplification and standards compliance",
-                    "jira_integration": "JIRA ticket extracted from PR and Atlassian MCP called if ticket found",
-                    "jira_compliance": "JIRA ticket data (if available) used for requirements and compliance analysis",
-                    "ticket_alignment": "Thorough analysis of whether implementation matches JIRA ticket specification using retrieved data"
-                }
+"""
+
+_ANALYSIS_REQUIREMENTS = (
+    "CRITICAL: Generate analysis in the EXACT format above",
+    "Use actual PR data (title, files, lines) - no placeholders",
+    "Focus on ANALYSIS ONLY - no code changes or implementations",
+    "Apply deep thinking about simplification opportunities",
+    "Extract JIRA ticket ID from PR title/body using regex pattern: SI-\\d+",
+    "If JIRA ticket found, execute Atlassian MCP command to retrieve ticket details",
+    "Use JIRA ticket data (summary, description, status, assignee, priority) for compliance analysis",
+    "Assess whether implementation matches JIRA ticket requirements based on retrieved data",
+    "Provide specific file:line references for all findings",
+    "Ensure all sections are completed with actual analysis",
+    "Replace ALL bracketed placeholders with real data/analysis",
+    "Include JIRA integration status in analysis even if ticket not found"
+)
+
+_QUALITY_STANDARDS = {
+    "focus_areas": (
+        "Code Simplification: Could this be simpler? Are there unnecessary complexities?",
+        "Standards Compliance: Does this follow established patterns and quality standards?",
+        "Architectural Coherence: Does this fit well with existing design patterns?",
+        "Business Logic Alignment: Do the changes properly match the ticket specification?",
+        "Test Strategy: Are tests comprehensive and following best practices?"
+    ),
+    "assessment_depth": "Comprehensive analysis covering violations, quality, tests, security, business logic, and JIRA compliance",
+    "output_specificity": "All findings must include specific file:line references and actionable solutions"
+}
+
+_SUCCESS_CRITERIA = {
+    "format_compliance": "Output matches the required structured format exactly",
+    "data_accuracy": "All PR information extracted successfully with real file:line references",
+    "analysis_completeness": "All sections completed with thorough analysis (no placeholders remaining)",
+    "actionable_output": "Specific, thoughtful recommendations provided (analysis only, no code changes)",
+    "deep_insights": "Meaningful assessment of code simplification and standards compliance",
+    "jira_integration": "JIRA ticket extracted from PR and Atlassian MCP called if ticket found",
+    "jira_compliance": "JIRA ticket data (if available) used for requirements and compliance analysis",
+    "ticket_alignment": "Thorough analysis of whether implementation matches JIRA ticket specification using retrieved data"
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _build_code_review(owner: str, repo: str, pr_number: str, focus: str, max_diff_lines: int, context_content: str) -> Dict[str, Any]:
+    """
+    Build the input-dependent part of the code_review instructions.
+    
+    The result is a pure function of its arguments, so repeat reviews of the same
+    PR are served from the cache. Per-call fields (timestamp, pr_url) are added by
+    the tool. Callers must not mutate the returned dict.
+    """
+    return {
+        "pr_owner": owner,
+        "pr_repo": repo,
+        "pr_number": pr_number,
+        "focus": focus,
+        "max_diff_lines": max_diff_lines,
+        
+        "processing_instructions": {
+            "overview": f"Extract PR data and generate comprehensive ANALYSIS-ONLY code review in structured format. Focus: {focus or 'comprehensive quality assessment'}. Apply deep thinking about simplification opportunities and standards compliance.",
+            
+            "data_extraction_steps": [
+                f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}\"{GH_CACHE_ARG} (PR details)",
+                f"Execute: gh pr diff {pr_number} --repo {owner}/{repo} | head -n {max_diff_lines} (code changes)",
+                f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/files\"{GH_FILES_CACHE_ARG} (files changed)",
+                f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/commits\" | jq -r '.[].sha' | tail -1 | xargs -I {{}} gh api \"repos/{owner}/{repo}/commits/{{}}/check-runs\" (CI status)",
+                f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/reviews\" (existing reviews)",
+                "Extract JIRA ticket from PR title/body (SI-XXXX pattern)",
+                f"If JIRA ticket found, execute: mcp__atlassian__getJiraIssue(cloudId='{Config.JIRA_CLOUD_ID}', issueIdOrKey='TICKET_ID', fields=['summary', 'description', 'status', 'assignee', 'priority']) to get ticket details for compliance analysis"
+            ],
+            
+            "execution_strategy": "The gh commands in data_extraction_steps are independent reads - issue them concurrently (parallel tool calls or background shell jobs) instead of one after another. Only the JIRA lookup has to wait for the PR title/body.",
+            
+            "required_output_format": _REVIEW_OUTPUT_FORMAT,
+            
+            "analysis_requirements": _ANALYSIS_REQUIREMENTS
+        },
+        
+        "quality_standards": _QUALITY_STANDARDS,
+        
+        "external_context": context_content,
+        
+        "success_criteria": _SUCCESS_CRITERIA
+    }
+
+
+def register_code_review_tool(mcp: FastMCP):
+    """Register the code_review tool with the FastMCP server"""
+    
+    @mcp.tool
+    def code_review(pr_url: str, focus: str = "", max_diff_lines: int = 2000) -> Dict[str, Any]:
+        """
+        Comprehensive code quality review of pull requests - ANALYSIS INSTRUCTIONS ONLY.
+        
+        **Natural Language Triggers:**
+        - "code review [PR_URL]"
+        - "review this PR [PR_URL]" 
+        - "analyze code quality in [PR_URL]"
+        - "check code standards [PR_URL]"
+        - "security review [PR_URL]"
+        - "performance review [PR_URL]"
+        - "review pr for [focus] [PR_URL]"
+        
+        **What this tool does:**
+        Returns comprehensive instructions for analyzing code quality, security, performance, and 
+        maintainability. Focuses on deep code analysis, standards compliance, and identifying 
+        improvement opportunities. Does NOT execute review - provides detailed analysis framework.
+        
+        **Perfect for:** Code quality assessment, security audits, performance optimization, 
+        standards compliance checking, mentoring feedback, pre-merge review.
+        
+        Args:
+            pr_url: GitHub PR URL to review (e.g., https://github.com/owner/repo/pull/123)
+            focus: Optional focus area ("security", "performance", "tests", "maintainability")
+            max_diff_lines: Maximum diff lines to analyze (default: 2000)
+            
+        Returns:
+            Detailed instructions for Claude Code to perform comprehensive code review
+        """
+        logger.info("code_review tool called for: %s", pr_url)
+        
+        try:
+            # Validate PR URL format
+            is_valid, components = ToolBase.validate_github_pr_url(pr_url)
+            if not is_valid:
+                return ToolBase.create_error_response(
+                    "Invalid GitHub PR URL format",
+                    pr_url,
+                    "validation_error"
+                )
+            
+            owner = components["owner"]
+            repo = components["repo"]
+            pr_number = components["pr_number"]
+            
+            context_content = ToolBase.load_external_context(
+                _CONTEXT_FILE,
+                get_context_fallback("code_review")
+            )
+            
+            # Return detailed analysis instructions
+            comprehensive_review = {
+                "tool_name": "code_review",
+                "analysis_context": "Comprehensive PR Code Review - Generate Structured Analysis",
+                "timestamp": datetime.now().isoformat(),
+                "pr_url": pr_url,
+                **_build_code_review(owner, repo, pr_number, focus, max_diff_lines, context_content)
             }
             
-            logger.info(f"Code review comprehensive analysis instructions generated for PR: {pr_url}")
+            logger.info("Code review comprehensive analysis instructions generated for PR: %s", pr_url)
             return comprehensive_review
             
         except Exception as e:
-            logger.error(f"Code review instruction generation error: {str(e)}")
+            logger.error("Code review instruction generation error: %s", e)
             return ToolBase.create_error_response(
                 f"Code review instruction generation failed: {str(e)}",
                 pr_url,
@@ -8,6 +8,7 @@ Provides contextual guidance based on team, service, and role-specific standards
 
 import logging
 import re
+from datetime import datetime
 from typing import Dict, Any, Optional
 
 from fastmcp import FastMCP
@@ -42,7 +43,7 @@ def register_enhanced_code_review_tool(mcp: FastMCP):
         Returns:
             Enhanced review instructions with integrated prompts and contextual resources
         """
-        logger.info(f"enhanced_code_review tool called: {pr_url}, role: {reviewer_role}, focus: {focus}")
+        logger.info("enhanced_code_review tool called: %s, role: %s, focus: %s", pr_url, reviewer_role, focus)
         
         try:
             # Validate PR URL
@@ -64,7 +65,7 @@ def register_enhanced_code_review_tool(mcp: FastMCP):
             response = {
                 "tool_name": "enhanced_code_review",
                 "analysis_context": f"Enhanced PR Review with Contextual Guidance - {focus.title()} Focus",
-                "timestamp": ToolBase.create_success_response({})["timestamp"],
+                "timestamp": datetime.now().isoformat(),
                 "pr_details": {
                     "url": pr_url,
                     "owner": owner,
@@ -99,7 +100,7 @@ def register_enhanced_code_review_tool(mcp: FastMCP):
             return ToolBase.create_success_response(response)
             
         except Exception as e:
-            logger.error(f"Enhanced code review failed: {str(e)}")
+            logger.error("Enhanced code review failed: %s", e)
             return ToolBase.create_error_response(
                 "Enhanced code review analysis failed", pr_url, "processing_error"
             )
@@ -8,6 +8,7 @@ Provides contextual guidance based on team, service, and role-specific standards
 
 import logging
 import re
+from datetime import datetime
 from typing import Dict, Any, Optional
 
 from fastmcp import FastMCP
@@ -286,7 +287,7 @@ Role-Based Comprehensive Review for {reviewer_role.replace('_', ' ').title()}
         Returns:
             Enhanced review instructions with contextual prompts and resources
         """
-        logger.info(f"enhanced_code_review_v2 tool called: {pr_url}, role: {reviewer_role}, focus: {focus}")
+        logger.info("enhanced_code_review_v2 tool called: %s, role: %s, focus: %s", pr_url, reviewer_role, focus)
         
         try:
             # Validate PR URL
@@ -308,7 +309,7 @@ Role-Based Comprehensive Review for {reviewer_role.replace('_', ' ').title()}
             response = {
                 "tool_name": "enhanced_code_review_v2",
                 "analysis_context": f"Enhanced PR Review v2.0 with Prompts & Resources - {focus.title()} Focus",
-                "timestamp": ToolBase.create_success_response({})["timestamp"],
+                "timestamp": datetime.now().isoformat(),
                 "pr_details": {
                     "url": pr_url,
                     "owner": owner,
@@ -392,7 +393,7 @@ This enhanced review leverages FastMCP 2.11.2 prompts and resources:
             return ToolBase.create_success_response(response)
             
         except Exception as e:
-            logger.error(f"Enhanced code review v2 failed: {str(e)}")
+            logger.error("Enhanced code review v2 failed: %s", e)
             return ToolBase.create_error_response(
                 "Enhanced code review analysis failed", pr_url, "processing_error"
             )
@@ -68,7 +68,7 @@ def register_epic_status_tool(mcp: FastMCP):
         """
         
         try:
-            logger.info(f"Generating epic status report for {epic_id} with focus: {focus}, tech_spec: {analyze_tech_spec}")
+            logger.info("Generating epic status report for %s with focus: %s, tech_spec: %s", epic_id, focus, analyze_tech_spec)
             
             # Base processing steps
             processing_steps = [
@@ -116,7 +116,7 @@ def register_epic_status_tool(mcp: FastMCP):
             }
             
         except Exception as e:
-            logger.error(f"Error generating epic status instructions: {e}")
+            logger.error("Error generating epic status instructions: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+JIRA Workflow Knowledge
+
+Status aliases and the transition graph shared by the jira_transition and
+get_jira_transitions tools, with lookup tables derived from them at import.
+"""
+
+from collections import deque
+from typing import Dict, List, Tuple
+
+from config.settings import Config
+
+# Status aliases for flexible input, and the reverse map used to resolve them.
+# Canonical names map to themselves so any casing of a real status resolves.
+STATUS_ALIASES = {
+    "In Development": ["dev", "development", "start", "begin", "work", "code"],
+    "Ready For Codereview": ["review", "codereview", "cr", "pr"],
+    "Ready for Validation": ["validation", "qa", "test", "testing"],
+    "In Validation": ["validating", "validate", "val"],
+    "Resolved": ["done", "resolved"],
+    "In Definition": ["definition", "define"],
+    "Ready For Eng": ["eng", "ready", "engineering"],
+    "In Design": ["design"],
+    "Open": ["open"],
+    "Blocked": ["blocked", "block", "stop"],
+    "Closed": ["closed", "close", "complete", "finish", "end"],
+    "Won't Do": ["wont", "cancel", "skip"],
+    "Reopened": ["reopened", "reopen"]
+}
+
+ALIAS_TO_STATUS = {
+    alias.lower(): status
+    for status, aliases in STATUS_ALIASES.items()
+    for alias in aliases
+}
+ALIAS_TO_STATUS.update({status.lower(): status for status in STATUS_ALIASES})
+
+# Embedded workflow transitions with standard JIRA transition names
+WORKFLOW_TRANSITIONS = {
+    "Open": {
+        "In Definition": "Start Definition",
+        "Closed": "Close Issue"
+    },
+    "In Definition": {
+        "Ready For Eng": "Ready for Engineering",
+        "Open": "Reopen",
+        "Blocked": "Block"
+    },
+    "Ready For Eng": {
+        "In Development": "Start Progress",
+        "In Definition": "Back to Definition",
+        "Blocked": "Block"
+    },
+    "In Development": {
+        "Ready For Codereview": "Ready for Code Review",
+        "In Definition": "Back to Definition",
+        "Blocked": "Block"
+    },
+    "Ready For Codereview": {
+        "Ready for Validation": "Ready for QA",
+        "In Development": "Back to Development",
+        "Blocked": "Block"
+    },
+    "Ready for Validation": {
+        "In Validation": "Start Validation",
+        "In Development": "Back to Development",
+        "Blocked": "Block"
+    },
+    "In Validation": {
+        "Resolved": "Resolve Issue",
+        "In Development": "Reject", 
+        "Ready for Validation": "Back to Ready for Validation"
+    },
+    "Resolved": {
+        "Closed": "Close Issue",
+        "Reopened": "Reopen",
+        "In Validation": "Reopen for Validation"
+    },
+    "Blocked": {
+        "In Definition": "Unblock to Definition",
+        "Ready For Eng": "Unblock to Ready for Eng", 
+        "In Development": "Unblock to Development",
+        "Ready For Codereview": "Unblock to Code Review"
+    }
+}
+
+
+def _build_path_table() -> Dict[Tuple[str, str], List[Dict[str, str]]]:
+    """
+    Precompute the shortest transition path for every reachable status pair.
+    
+    The workflow graph is small and static, so one BFS per source status at
+    import replaces a search on every get_jira_transitions call. Paths are
+    shared between calls and must not be mutated.
+    """
+    table = {}
+    for start in WORKFLOW_TRANSITIONS:
+        # Parent pointers from the BFS; each path is reconstructed once at the end
+        parents = {start: None}
+        queue = deque([start])
+        
+        while queue:
+            current = queue.popleft()
+            for next_status, transition_name in WORKFLOW_TRANSITIONS.get(current, {}).items():
+                if next_status not in parents:
+                    parents[next_status] = (current, transition_name)
+                    queue.append(next_status)
+        
+        for target in parents:
+            if target == start:
+                continue
+            path = []
+            status = target
+            while parents[status]:
+                previous, transition_name = parents[status]
+                path.append({"from": previous, "to": status, "transition_name": transition_name})
+                status = previous
+            path.reverse()
+            table[(start, target)] = path
+    
+    return table
+
+
+PATH_TABLE = _build_path_table()
+
+# Atlassian MCP command for one transition; [TICKET_ID] is filled in by the client
+_TRANSITION_COMMAND = 'mcp__atlassian__transitionJiraIssue(cloudId="{cloud_id}", issueIdOrKey="[TICKET_ID]", transition={{"name": "{transition_name}"}})'
+
+# Ready-to-run transition commands for each PATH_TABLE entry, one per step
+COMMAND_TABLE = {
+    pair: tuple(
+        _TRANSITION_COMMAND.format(cloud_id=Config.JIRA_CLOUD_ID, transition_name=step["transition_name"])
+        for step in path
+    )
+    for pair, path in PATH_TABLE.items()
+}
@@ -7,15 +7,167 @@ Provides detailed step-by-step instructions for Claude Code to perform comprehen
 PR health assessment with actionable solutions for blocking issues.
 """
 
+import functools
 import logging
+from datetime import datetime
 from typing import Dict, Any
 
 from fastmcp import FastMCP
-from .base import ToolBase, get_context_fallback
+from .base import GH_CACHE_ARG, ToolBase, get_context_fallback
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# External context file; re-read only when its mtime changes
+_CONTEXT_FILE = "/Users/dlighty/code/llm-context/PR-HEALTH-CONTEXT.md"
+
+# Static parts of the pr_health instructions, built once at import. The
+# [PLACEHOLDER] markers in the template are filled in by the executing agent.
+_HEALTH_OUTPUT_FORMAT = """
+## 🏥 PR Health Analysis: [ACTUAL_PR_TITLE]
+
+**Repository**: [REPO] #[NUMBER]
+**PR Title**: [ACTUAL_PR_TITLE]
+**Overall Status**: [READY|NEEDS_ATTENTION|BLOCKED]
+**Author**: [username]
+**JIRA**: [SI-XXXX or none]
+**Confidence Score**: [0.0-1.0]
+**Quality Grade**: [A+/A/B+/B/C]
+
+### 🚨 Blocking Issues ([count])
+- [ ] Issue description with file:line reference
+- [ ] Issue description with file:line reference
+
+### ⚡ High Priority ([count])  
+- [ ] Issue description with file:line reference
+
+### 📝 Medium Priority ([count])
+- [ ] Issue description with file:line reference
+
+### 💬 Discussion Threads ([count])
+
+#### Thread 1: [file:line] - Complexity: [SIMPLE|MEDIUM|HARD]
+**Question**: [reviewer's question/comment]
+**Solution**: [terse 1-2 sentence solution]
+
+#### Thread 2: [file:line] - Complexity: [SIMPLE|MEDIUM|HARD]
+**Question**: [reviewer's question/comment]
+**Solution**: [terse 1-2 sentence solution]
+
+### 📊 Status Summary
+- **Open Threads**: X total (Y simple, Z medium, W hard)
+- **CI Status**: X passed, Y failed, Z pending
+- **Merge Status**: [READY|CONFLICTS|PENDING_CHECKS]
+- **JIRA Ticket**: [SI-XXXX or none]
+- **Last Updated**: [timestamp]
+
+### 🎯 Next Actions
+1. **Address [complexity] thread**: [specific action with proposed solution]
+2. **Implement solution**: [concrete implementation steps]
+3. **Follow up**: [verification or additional steps needed]
+
+Thread Complexity Assessment:
+• SIMPLE: Straightforward explanation, code comment, or minor clarification
+• MEDIUM: Requires code analysis, logic explanation, or minor refactoring  
+• HARD: Complex architectural decision, major refactoring, or design pattern change
+
+Scaling Rules:
+• 1-3 threads: Brief analysis + solution
+• 4-10 threads: Terse solutions only (1-2 sentences)
+• 10+ threads: Essential solutions, group by complexity
+"""
+
+_ANALYSIS_REQUIREMENTS = (
+    "Filter review threads to ONLY open threads (not resolved, collapsed, or outdated)",
+    "Analyze ONLY open threads (not resolved, collapsed, or outdated)",
+    "Extract code context around each thread location (±10 lines)",
+    "Classify thread complexity: SIMPLE (explanation), MEDIUM (code analysis), HARD (architectural)",
+    "Extract JIRA ticket ID from PR title/body using regex pattern: SI-\\d+",
+    "If JIRA ticket found, execute Atlassian MCP command to retrieve ticket details for context",
+    "Use JIRA ticket data (if available) to understand the intended changes and assess violations",
+    "Provide actionable solutions with specific file:line references",
+    "Generate quality confidence score (0.0-1.0) and grade (A+ to C)",
+    "Include JIRA ticket detection and compliance checking",
+    "Scale output appropriately: 1-3 threads = detailed, 4-10 = terse, 10+ = essential only"
+)
+
+_HEALTH_CATEGORIES = {
+    "blocking": {
+        "description": "Issues that prevent merge (conflicts, failed CI, security)",
+        "priority": "immediate",
+        "examples": "merge conflicts, failing tests, security vulnerabilities"
+    },
+    "high_priority": {
+        "description": "Code quality issues requiring attention",
+        "priority": "urgent", 
+        "examples": "missing tests, code quality issues, performance problems"
+    },
+    "medium_priority": {
+        "description": "Style and improvement suggestions",
+        "priority": "moderate",
+        "examples": "style issues, refactoring suggestions, documentation"
+    },
+    "discussion": {
+        "description": "Questions and clarifications from reviewers",
+        "priority": "responsive",
+        "examples": "clarifying questions, design discussions, approach validation"
+    }
+}
+
+_SUCCESS_CRITERIA = {
+    "data_extraction": "PR details, threads, CI status, and code context successfully extracted",
+    "health_classification": "All health issues categorized by priority with actionable solutions",
+    "thread_analysis": "Open threads analyzed with complexity assessment and solutions",
+    "jira_integration": "JIRA ticket extracted from PR and Atlassian MCP called if ticket found",
+    "jira_context": "JIRA ticket data (if available) used to understand intended changes and assess health issues",
+    "quality_scoring": "Confidence score and quality grade assigned based on analysis completeness",
+    "actionable_output": "Structured report with file:line references and next steps provided"
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _build_pr_health(owner: str, repo: str, pr_number: str, description: str, context_content: str) -> Dict[str, Any]:
+    """
+    Build the cacheable part of the pr_health instructions.
+    
+    Only owner/repo/number, the focus description and the context vary, so the
+    dict is memoized on them; the tool adds timestamp and pr_url per call.
+    Callers must not mutate the returned dict.
+    """
+    return {
+        "pr_owner": owner,
+        "pr_repo": repo,
+        "pr_number": pr_number,
+        "description": description,
+        
+        "processing_instructions": {
+            "overview": f"Extract PR data and generate comprehensive health assessment with review threads, CI status, merge readiness, and blocking issue resolution. Focus: {description or 'comprehensive health evaluation with actionable recommendations'}.",
+            
+            "data_extraction_steps": [
+                f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}\"{GH_CACHE_ARG} (PR details)",
+                f"Execute: gh api graphql -f query='{{repository(owner:\\\"{owner}\\\", name:\\\"{repo}\\\"){{pullRequest(number:{pr_number}){{reviewThreads(first:100){{nodes{{id isResolved isCollapsed isOutdated path line startLine originalLine originalStartLine diffSide comments(first:20){{nodes{{id author{{login}} body createdAt outdated}}}}}}}}}}}}}}' (review threads)",
+                f"Execute: gh api \"repos/{owner}/{repo}/commits/$(gh api \\\"repos/{owner}/{repo}/pulls/{pr_number}\\\" --jq '.head.sha')/check-runs\" (CI status)",
+                f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/comments\" (inline comments)",
+                f"Execute: gh pr view {pr_number} --repo {owner}/{repo} --json mergeable,mergeStateStatus (merge status)",
+                "Extract JIRA ticket from PR title/body (SI-XXXX pattern)",
+                f"If JIRA ticket found, execute: mcp__atlassian__getJiraIssue(cloudId='{Config.JIRA_CLOUD_ID}', issueIdOrKey='TICKET_ID', fields=['summary', 'description', 'status']) to get ticket context for health analysis",
+                "Get code context for each thread location using GitHub Contents API"
+            ],
+            
+            "execution_strategy": "Run the five gh commands concurrently (parallel tool calls or background shell jobs) - none depends on another. Only the JIRA lookup (needs the PR title/body) and the per-thread code context fetches (need the review threads) must wait.",
+            
+            "required_output_format": _HEALTH_OUTPUT_FORMAT,
+            
+            "analysis_requirements": _ANALYSIS_REQUIREMENTS
+        },
+        
+        "health_categories": _HEALTH_CATEGORIES,
+        
+        "external_context": context_content,
+        
+        "success_criteria": _SUCCESS_CRITERIA
+    }
+
 
 def register_pr_health_tool(mcp: FastMCP):
     """Register the pr_health tool with the FastMCP server"""
@@ -48,7 +200,7 @@ def register_pr_health_tool(mcp: FastMCP):
         Returns:
             Comprehensive instructions for Claude Code to perform PR health analysis
         """
-        logger.info(f"pr_health tool called for: {pr_url}")
+        logger.info("pr_health tool called for: %s", pr_url)
         
         try:
             # Validate PR URL format
@@ -64,9 +216,8 @@ def register_pr_health_tool(mcp: FastMCP):
             repo = components["repo"]
             pr_number = components["pr_number"]
             
-            # Load external context for PR health analysis
             context_content = ToolBase.load_external_context(
-                "/Users/dlighty/code/llm-context/PR-HEALTH-CONTEXT.md",
+                _CONTEXT_FILE,
                 get_context_fallback("pr_health")
             )
             
@@ -74,137 +225,16 @@ def register_pr_health_tool(mcp: FastMCP):
             health_analysis = {
                 "tool_name": "pr_health",
                 "analysis_context": "PR Health Analysis - Generate Comprehensive Health Assessment",
-                "timestamp": ToolBase.create_success_response({})["timestamp"],
+                "timestamp": datetime.now().isoformat(),
                 "pr_url": pr_url,
-                "pr_owner": owner,
-                "pr_repo": repo,
-                "pr_number": pr_number,
-                "description": description,
-                
-                "processing_instructions": {
-                    "overview": f"Extract PR data and generate comprehensive health assessment with review threads, CI status, merge readiness, and blocking issue resolution. Focus: {description or 'comprehensive health evaluation with actionable recommendations'}.",
-                    
-                    "data_extraction_steps": [
-                        f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}\" (PR details)",
-                        f"Execute: gh api graphql -f query='{{repository(owner:\\\"{owner}\\\", name:\\\"{repo}\\\"){{pullRequest(number:{pr_number}){{reviewThreads(first:100){{nodes{{id isResolved isCollapsed isOutdated path line startLine originalLine originalStartLine diffSide comments(first:20){{nodes{{id author{{login}} body createdAt outdated}}}}}}}}}}}}}}' (review threads)",
-                        f"Execute: gh api \"repos/{owner}/{repo}/commits/$(gh api \\\"repos/{owner}/{repo}/pulls/{pr_number}\\\" --jq '.head.sha')/check-runs\" (CI status)",
-                        f"Execute: gh api \"repos/{owner}/{repo}/pulls/{pr_number}/comments\" (inline comments)",
-                        f"Execute: gh pr view {pr_number} --repo {owner}/{repo} --json mergeable,mergeStateStatus (merge status)",
-                        "Extract JIRA ticket from PR title/body (SI-XXXX pattern)",
-                        "If JIRA ticket found, execute: mcp__atlassian__getJiraIssue(cloudId='credify.atlassian.net', issueIdOrKey='TICKET_ID', fields=['summary', 'description', 'status']) to get ticket context for health analysis",
-                        "Get code context for each thread location using GitHub Contents API"
-                    ],
-                    
-                    "required_output_format": """
-## 🏥 PR Health Analysis: [ACTUAL_PR_TITLE]
-
-**Repository**: [REPO] #[NUMBER]
-**PR Title**: [ACTUAL_PR_TITLE]
-**Overall Status**: [READY|NEEDS_ATTENTION|BLOCKED]
-**Author**: [username]
-**JIRA**: [SI-XXXX or none]
-**Confidence Score**: [0.0-1.0]
-**Quality Grade**: [A+/A/B+/B/C]
-
-### 🚨 Blocking Issues ([count])
-- [ ] Issue description with file:line reference
-- [ ] Issue description with file:line reference
-
-### ⚡ High Priority ([count])  
-- [ ] Issue description with file:line reference
-
-### 📝 Medium Priority ([count])
-- [ ] Issue description with file:line reference
-
-### 💬 Discussion Threads ([count])
-
-#### Thread 1: [file:line] - Complexity: [SIMPLE|MEDIUM|HARD]
-**Question**: [reviewer's question/comment]
-**Solution**: [terse 1-2 sentence solution]
-
-#### Thread 2: [file:line] - Complexity: [SIMPLE|MEDIUM|HARD]
-**Question**: [reviewer's question/comment]
-**Solution**: [terse 1-2 sentence solution]
-
-### 📊 Status Summary
-- **Open Threads**: X total (Y simple, Z medium, W hard)
-- **CI Status**: X passed, Y failed, Z pending
-- **Merge Status**: [READY|CONFLICTS|PENDING_CHECKS]
-- **JIRA Ticket**: [SI-XXXX or none]
-- **Last Updated**: [timestamp]
-
-### 🎯 Next Actions
-1. **Address [complexity] thread**: [specific action with proposed solution]
-2. **Implement solution**: [concrete implementation steps]
-3. **Follow up**: [verification or additional steps needed]
-
-Thread Complexity Assessment:
-• SIMPLE: Straightforward explanation, code comment, or minor clarification
-• MEDIUM: Requires code analysis, logic explanation, or minor refactoring  
-• HARD: Complex architectural decision, major refactoring, or design pattern change
-
-Scaling Rules:
-• 1-3 threads: Brief analysis + solution
-• 4-10 threads: Terse solutions only (1-2 sentences)
-• 10+ threads: Essential solutions, group by complexity
-""",
-                    
-                    "analysis_requirements": [
-                        "Filter review threads to ONLY open threads (not resolved, collapsed, or outdated)",
-                        "Analyze ONLY open threads (not resolved, collapsed, or outdated)",
-                        "Extract code context around each thread location (±10 lines)",
-                        "Classify thread complexity: SIMPLE (explanation), MEDIUM (code analysis), HARD (architectural)",
-                        "Extract JIRA ticket ID from PR title/body using regex pattern: SI-\\d+",
-                        "If JIRA ticket found, execute Atlassian MCP command to retrieve ticket details for context",
-                        "Use JIRA ticket data (if available) to understand the intended changes and assess violations",
-                        "Provide actionable solutions with specific file:line references",
-                        "Generate quality confidence score (0.0-1.0) and grade (A+ to C)",
-                        "Include JIRA ticket detection and compliance checking",
-                        "Scale output appropriately: 1-3 threads = detailed, 4-10 = terse, 10+ = essential only"
-                    ]
-                },
-                
-                "health_categories": {
-                    "blocking": {
-                        "description": "Issues that prevent merge (conflicts, failed CI, security)",
-                        "priority": "immediate",
-                        "examples": "merge conflicts, failing tests, security vulnerabilities"
-                    },
-                    "high_priority": {
-                        "description": "Code quality issues requiring attention",
-                        "priority": "urgent", 
-                        "examples": "missing tests, code quality issues, performance problems"
-                    },
-                    "medium_priority": {
-                        "description": "Style and improvement suggestions",
-                        "priority": "moderate",
-                        "examples": "style issues, refactoring suggestions, documentation"
-                    },
-                    "discussion": {
-                        "description": "Questions and clarifications from reviewers",
-                        "priority": "responsive",
-                        "examples": "clarifying questions, design discussions, approach validation"
-                    }
-                },
-                
-                "external_context": context_content,
-                
-                "success_criteria": {
-                    "data_extraction": "PR details, threads, CI status, and code context successfully extracted",
-                    "health_classification": "All health issues categorized by priority with actionable solutions",
-                    "thread_analysis": "Open threads analyzed with complexity assessment and solutions",
-                    "jira_integration": "JIRA ticket extracted from PR and Atlassian MCP called if ticket found",
-                    "jira_context": "JIRA ticket data (if available) used to understand intended changes and assess health issues",
-                    "quality_scoring": "Confidence score and quality grade assigned based on analysis completeness",
-                    "actionable_output": "Structured report with file:line references and next steps provided"
-                }
+                **_build_pr_health(owner, repo, pr_number, description, context_content)
             }
             
-            logger.info(f"PR health orchestration instructions generated for: {pr_url}")
+            logger.info("PR health orchestration instructions generated for: %s", pr_url)
             return health_analysis
             
         except Exception as e:
-            logger.error(f"Error generating PR health orchestration: {str(e)}")
+            logger.error("Error generating PR health orchestration: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to generate PR health orchestration: {str(e)}",
                 pr_url,
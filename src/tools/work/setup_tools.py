@@ -10,6 +10,7 @@ tool execution more streamlined once setup is complete.
 import logging
 import subprocess
 import sys
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 import json
 
@@ -46,7 +47,7 @@ def register_setup_tools(mcp: FastMCP):
         try:
             setup_results = {
                 "tool_name": "setup_prerequisites",
-                "timestamp": ToolBase.create_success_response({})["timestamp"],
+                "timestamp": datetime.now().isoformat(),
                 "validation_results": {},
                 "setup_actions": [],
                 "overall_status": "unknown"
@@ -80,11 +81,11 @@ def register_setup_tools(mcp: FastMCP):
             # Add summary
             setup_results["summary"] = generate_setup_summary(setup_results)
             
-            logger.info(f"Prerequisites validation completed: {setup_results['overall_status']}")
+            logger.info("Prerequisites validation completed: %s", setup_results['overall_status'])
             return setup_results
             
         except Exception as e:
-            logger.error(f"Error during prerequisites validation: {str(e)}")
+            logger.error("Error during prerequisites validation: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to validate prerequisites: {str(e)}",
                 error_type=type(e).__name__
@@ -101,7 +102,7 @@ def register_setup_tools(mcp: FastMCP):
         Returns:
             Dictionary containing tool-specific requirement status
         """
-        logger.info(f"Checking requirements for tool: {tool_name}")
+        logger.info("Checking requirements for tool: %s", tool_name)
         
         try:
             tool_requirements = get_tool_requirements()
@@ -138,11 +139,11 @@ def register_setup_tools(mcp: FastMCP):
                 "requirements_met": all_met,
                 "requirement_details": requirement_status,
                 "tool_description": requirements.get("description", ""),
-                "timestamp": ToolBase.create_success_response({})["timestamp"]
+                "timestamp": datetime.now().isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Error checking tool requirements: {str(e)}")
+            logger.error("Error checking tool requirements: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to check tool requirements: {str(e)}",
                 error_type=type(e).__name__
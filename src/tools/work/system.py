@@ -17,10 +17,12 @@ monitoring server health, debugging communication problems, system performance a
 confirming server responsiveness and proper tool registration.
 """
 
+import asyncio
+import heapq
 import logging
 import sys
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 import psutil
 from fastmcp import FastMCP
@@ -30,6 +32,46 @@ from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# CPU count never changes at runtime. Priming cpu_percent here lets later calls
+# use interval=None (non-blocking, measured since the previous call) instead of
+# sleeping the event loop for a full sampling interval.
+_CPU_COUNT = psutil.cpu_count()
+psutil.cpu_percent(interval=None)
+
+# Platform, interpreter and CPU count are fixed for the process lifetime
+_STATIC_SYSTEM_INFO = {
+    "platform": sys.platform,
+    "python_version": sys.version,
+    "cpu_count": _CPU_COUNT
+}
+
+_PROCESS_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_percent']
+
+# Server and environment details come from Config, which is fixed once the
+# process has started; read it once here rather than on every call
+_SERVER_INFO = {
+    "name": "mcp-tools-fastmcp",
+    "version": "2.0.0",
+    "port": Config.DEFAULT_PORT,
+    "transport": "http-streaming"
+}
+
+_ENVIRONMENT_INFO = {
+    "log_level": Config.LOG_LEVEL,
+    "tool_timeout": Config.TOOL_TIMEOUT,
+    "rate_limit": Config.RATE_LIMIT
+}
+
+
+def _top_processes(limit: int = 10) -> List[Dict[str, Any]]:
+    """Return the busiest processes by CPU without materializing the full process list"""
+    top = heapq.nlargest(
+        limit,
+        psutil.process_iter(attrs=_PROCESS_ATTRS, ad_value=None),
+        key=lambda proc: proc.info['cpu_percent'] or 0.0
+    )
+    return [proc.info for proc in top]
+
 
 def register_system_tools(mcp: FastMCP):
     """Register system tools with the FastMCP server"""
@@ -47,7 +89,7 @@ def register_system_tools(mcp: FastMCP):
         Returns:
             Dictionary containing the echoed text and server information
         """
-        logger.info(f"Echo tool called with text: {text}")
+        logger.info("Echo tool called with text: %s", text)
         
         return ToolBase.create_success_response({
             "echoed_text": text,
@@ -55,7 +97,7 @@ def register_system_tools(mcp: FastMCP):
         })
     
     @mcp.tool
-    def get_system_info(include_processes: bool = False) -> Dict[str, Any]:
+    async def get_system_info(include_processes: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive system information and server diagnostics.
         
@@ -70,46 +112,32 @@ def register_system_tools(mcp: FastMCP):
         logger.info("System info tool called")
         
         try:
+            vm = psutil.virtual_memory()
+            
             # Basic system info
             system_info = {
-                "server": {
-                    "name": "mcp-tools-fastmcp",
-                    "version": "2.0.0",
-                    "port": Config.DEFAULT_PORT,
-                    "transport": "http-streaming"
-                },
+                "server": _SERVER_INFO,
                 "system": {
-                    "platform": sys.platform,
-                    "python_version": sys.version,
-                    "cpu_count": psutil.cpu_count(),
-                    "cpu_percent": psutil.cpu_percent(interval=1),
-                    "memory_total": psutil.virtual_memory().total,
-                    "memory_available": psutil.virtual_memory().available,
-                    "memory_percent": psutil.virtual_memory().percent,
+                    **_STATIC_SYSTEM_INFO,
+                    "cpu_percent": psutil.cpu_percent(interval=None),
+                    "memory_total": vm.total,
+                    "memory_available": vm.available,
+                    "memory_percent": vm.percent,
                     "disk_usage": psutil.disk_usage('/').percent
                 },
-                "environment": {
-                    "log_level": Config.LOG_LEVEL,
-                    "tool_timeout": Config.TOOL_TIMEOUT,
-                    "rate_limit": Config.RATE_LIMIT
-                }
+                "environment": _ENVIRONMENT_INFO
             }
             
             # Add process information if requested
             if include_processes:
-                processes = []
-                for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                    try:
-                        processes.append(proc.info)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-                system_info["processes"] = processes[:10]  # Top 10 processes
+                # /proc reads scale with host process count; keep them off the event loop
+                system_info["processes"] = await asyncio.to_thread(_top_processes, 10)
             
             logger.info("System info retrieved successfully")
             return ToolBase.create_success_response(system_info)
             
         except Exception as e:
-            logger.error(f"Error getting system info: {e}")
+            logger.error("Error getting system info: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to get system info: {str(e)}",
                 error_type=type(e).__name__
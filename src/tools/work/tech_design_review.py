@@ -18,6 +18,9 @@ from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+_CONFLUENCE_PAGE_PATTERN = re.compile(r'/pages/(\d+)/')
+_GITHUB_BLOB_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/blob/[^/]+/(.+)')
+
 
 def register_tech_design_review_tool(mcp: FastMCP):
     """Register the tech_design_review tool with the FastMCP server"""
@@ -44,7 +47,7 @@ def register_tech_design_review_tool(mcp: FastMCP):
         Returns:
             Dictionary containing detailed processing instructions for Claude Code execution
         """
-        logger.info(f"tech_design_review tool called for: {document_url}")
+        logger.info("tech_design_review tool called for: %s", document_url)
         
         try:
             # Validate URL format (Confluence or GitHub)
@@ -71,7 +74,7 @@ def register_tech_design_review_tool(mcp: FastMCP):
             design_review_analysis = {
                 "tool_name": "tech_design_review",
                 "analysis_context": "Technical Design Document Review - Comprehensive Analysis and Improvement",
-                "timestamp": ToolBase.create_success_response({})["timestamp"],
+                "timestamp": datetime.now().isoformat(),
                 "document_url": document_url,
                 "focus_area": focus_area,
                 "design_phase": design_phase,
@@ -79,18 +82,18 @@ def register_tech_design_review_tool(mcp: FastMCP):
                 "document_components": doc_components,
                 
                 "processing_instructions": _get_processing_instructions(doc_components, is_confluence, is_github),
-                "required_output_format": _get_output_format(),
-                "analysis_requirements": _get_analysis_requirements(),
-                "review_categories": _get_review_categories(),
+                "required_output_format": _OUTPUT_FORMAT,
+                "analysis_requirements": _ANALYSIS_REQUIREMENTS,
+                "review_categories": _REVIEW_CATEGORIES,
                 "external_context": context_content,
-                "success_criteria": _get_success_criteria()
+                "success_criteria": _SUCCESS_CRITERIA
             }
             
-            logger.info(f"Tech design review instructions generated for: {document_url}")
+            logger.info("Tech design review instructions generated for: %s", document_url)
             return design_review_analysis
             
         except Exception as e:
-            logger.error(f"Error generating tech design review instructions: {str(e)}")
+            logger.error("Error generating tech design review instructions: %s", e)
             return ToolBase.create_error_response(
                 f"Failed to generate tech design review instructions: {str(e)}",
                 document_url,
@@ -104,14 +107,14 @@ def _extract_document_components(document_url: str) -> Dict[str, str]:
     
     if "credify.atlassian.net" in document_url:
         # Confluence URL - extract page ID
-        page_match = re.search(r'/pages/(\d+)/', document_url)
+        page_match = _CONFLUENCE_PAGE_PATTERN.search(document_url)
         if page_match:
             components["page_id"] = page_match.group(1)
         components["type"] = "confluence"
         
     elif "github.com" in document_url:
         # GitHub URL - extract owner, repo, file path
-        github_match = re.match(r'https://github\.com/([^/]+)/([^/]+)/blob/[^/]+/(.+)', document_url)
+        github_match = _GITHUB_BLOB_URL_PATTERN.match(document_url)
         if github_match:
             components["owner"] = github_match.group(1)
             components["repo"] = github_match.group(2) 
@@ -164,7 +167,7 @@ def _get_processing_instructions(doc_components, is_confluence, is_github):
         
         "phase_1_basic_structure": [
             "1. **Document Access**: Execute appropriate command to fetch document content:",
-            f"   - Confluence: mcp__atlassian__getConfluencePage(cloudId='credify.atlassian.net', pageId='{doc_components.get('page_id', 'EXTRACT_FROM_URL')}')" if is_confluence else "",
+            f"   - Confluence: mcp__atlassian__getConfluencePage(cloudId='{Config.JIRA_CLOUD_ID}', pageId='{doc_components.get('page_id', 'EXTRACT_FROM_URL')}')" if is_confluence else "",
             f"   - GitHub: gh api 'repos/{doc_components.get('owner', '')}/{doc_components.get('repo', '')}/contents/{doc_components.get('file_path', '')}' --jq '.content' | base64 -d" if is_github else "",
             f"   - Local: Read file directly from path: {doc_components.get('file_path', '')}" if not (is_confluence or is_github) else "",
             "",
@@ -201,9 +204,10 @@ def _get_processing_instructions(doc_components, is_confluence, is_github):
     return instructions
 
 
-def _get_output_format():
-    """Get the required output format template"""
-    return """
+# Static sections of the response, built once at import
+
+# Required output format template
+_OUTPUT_FORMAT = """
 ## 🎯 Technical Design Review: [DOCUMENT_TITLE]
 
 **Document**: [CONFLUENCE_URL or GITHUB_URL]
@@ -313,69 +317,66 @@ Your design has been analyzed and specific improvement areas identified. **Let's
 """
 
 
-def _get_analysis_requirements():
-    """Get analysis requirements list"""
-    return [
-        "Fetch document content using appropriate method (Confluence API, GitHub API, or file read)",
-        "Validate basic document structure and required sections",
-        "Check business spec alignment by fetching linked business document", 
-        "Navigate to target repository and analyze current codebase state",
-        "Assess architecture changes against existing code patterns",
-        "Analyze service-to-service integration patterns and @RunAsService usage",
-        "Verify authorization scopes for new or modified service integrations",
-        "Check for required login-server application.properties updates",
-        "Evaluate complexity appropriateness for problem being solved",
-        "Generate confidence score and overall grade with justification",
-        "Provide actionable recommendations with specific implementation guidance",
-        "Create Claude Code commands for immediate design document improvement",
-        "Generate implementation checklists and missing documentation items",
-        "Follow Upgrade development standards and coding patterns",
-        "Consider worktree project structures for LHSS/CHSS repositories"
-    ]
-
-
-def _get_review_categories():
-    """Get review categories configuration"""
-    return {
-        "basic_structure": {
-            "description": "Document completeness, links, and basic organization",
-            "priority": "critical",
-            "checks": ["business_spec_linked", "stakeholders_identified", "epic_linked", "objective_clear"]
-        },
-        "business_alignment": {
-            "description": "Alignment between business requirements and technical solution",
-            "priority": "critical", 
-            "checks": ["objective_match", "requirements_coverage", "scope_appropriate"]
-        },
-        "architecture_analysis": {
-            "description": "Technical architecture and implementation feasibility",
-            "priority": "high",
-            "checks": ["database_changes", "domain_model", "api_changes", "auth_requirements", "standards_compliance"]
-        },
-        "service_authorization": {
-            "description": "Service-to-service authorization and scope configuration",
-            "priority": "critical",
-            "checks": ["run_as_service_usage", "new_service_scopes", "login_server_updates", "scope_coverage"]
-        },
-        "security_review": {
-            "description": "Security requirements and PII data handling", 
-            "priority": "high",
-            "checks": ["pii_encryption", "authorization_checks", "data_access_patterns"]
-        }
+# Analysis requirements list
+_ANALYSIS_REQUIREMENTS = [
+    "Fetch document content using appropriate method (Confluence API, GitHub API, or file read)",
+    "Validate basic document structure and required sections",
+    "Check business spec alignment by fetching linked business document", 
+    "Navigate to target repository and analyze current codebase state",
+    "Assess architecture changes against existing code patterns",
+    "Analyze service-to-service integration patterns and @RunAsService usage",
+    "Verify authorization scopes for new or modified service integrations",
+    "Check for required login-server application.properties updates",
+    "Evaluate complexity appropriateness for problem being solved",
+    "Generate confidence score and overall grade with justification",
+    "Provide actionable recommendations with specific implementation guidance",
+    "Create Claude Code commands for immediate design document improvement",
+    "Generate implementation checklists and missing documentation items",
+    "Follow Upgrade development standards and coding patterns",
+    "Consider worktree project structures for LHSS/CHSS repositories"
+]
+
+
+# Review categories configuration
+_REVIEW_CATEGORIES = {
+    "basic_structure": {
+        "description": "Document completeness, links, and basic organization",
+        "priority": "critical",
+        "checks": ["business_spec_linked", "stakeholders_identified", "epic_linked", "objective_clear"]
+    },
+    "business_alignment": {
+        "description": "Alignment between business requirements and technical solution",
+        "priority": "critical", 
+        "checks": ["objective_match", "requirements_coverage", "scope_appropriate"]
+    },
+    "architecture_analysis": {
+        "description": "Technical architecture and implementation feasibility",
+        "priority": "high",
+        "checks": ["database_changes", "domain_model", "api_changes", "auth_requirements", "standards_compliance"]
+    },
+    "service_authorization": {
+        "description": "Service-to-service authorization and scope configuration",
+        "priority": "critical",
+        "checks": ["run_as_service_usage", "new_service_scopes", "login_server_updates", "scope_coverage"]
+    },
+    "security_review": {
+        "description": "Security requirements and PII data handling", 
+        "priority": "high",
+        "checks": ["pii_encryption", "authorization_checks", "data_access_patterns"]
     }
-
-
-def _get_success_criteria():
-    """Get success criteria for the analysis"""
-    return {
-        "document_access": "Design document content successfully retrieved and parsed",
-        "structure_validation": "Basic document structure validated against requirements",
-        "business_alignment": "Business spec retrieved and alignment verified",
-        "repository_analysis": "Target repository accessed and current state analyzed", 
-        "architecture_assessment": "Architecture changes validated against existing codebase",
-        "service_authorization": "Service-to-service calls analyzed for @RunAsService and scope requirements",
-        "login_server_verification": "Login-server configuration requirements identified for new service integrations",
-        "scope_coverage": "Authorization scope coverage verified for existing and new service operations",
-        "actionable_recommendations": "Specific, implementable recommendations provided",
-        "quality_scoring": "Confidence score and grade assigned with justification"
-    }
\ No newline at end of file
+}
+
+
+# Success criteria for the analysis
+_SUCCESS_CRITERIA = {
+    "document_access": "Design document content successfully retrieved and parsed",
+    "structure_validation": "Basic document structure validated against requirements",
+    "business_alignment": "Business spec retrieved and alignment verified",
+    "repository_analysis": "Target repository accessed and current state analyzed", 
+    "architecture_assessment": "Architecture changes validated against existing codebase",
+    "service_authorization": "Service-to-service calls analyzed for @RunAsService and scope requirements",
+    "login_server_verification": "Login-server configuration requirements identified for new service integrations",
+    "scope_coverage": "Authorization scope coverage verified for existing and new service operations",
+    "actionable_recommendations": "Specific, implementable recommendations provided",
+    "quality_scoring": "Confidence score and grade assigned with justification"
+}
\ No newline at end of file